@@ -1,4 +1,5 @@
 import datetime
+import os
 import random
 import time
 from pathlib import Path
@@ -8,8 +9,9 @@ import speech_recognition as sr # <-- NEW IMPORT for Speech Recognition
 import webbrowser
 import subprocess
 import platform
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+import sys
+import threading
+# torch and transformers are imported by _load_ai_models in a background thread; they take seconds to import.
 
 # --- Utility Functions (Time/Speed Calculation Simulation) ---
 
@@ -24,6 +26,143 @@ def calculate_time_speed(func):
         return result, f"Function executed in {elapsed:.6f} seconds.\nCalculated Relative Speed: **{relative_speed:.2f} m/s**."
     return wrapper
 
+# --- NEW: Compiled Command Router ---
+from gideon_router import CommandRouter  # Shared with Gideon.py3
+
+# --- NEW: Local Inference Engine (KV-cache reuse) ---
+
+class LocalInferenceEngine:
+    """
+    DialoGPT inference that keeps the model's attention cache (past_key_values) between
+    turns, so each turn only runs its new tokens through the model instead of re-reading
+    the whole conversation. Optionally loads a dynamically quantized int8 copy of the
+    model for CPU inference, pins the thread count, and streams the reply token by token.
+    """
+    def __init__(self, model_name="microsoft/DialoGPT-large", device=None, quantize=False, num_threads=None,
+                 history_token_budget=600, max_new_tokens=120):
+        self.model_name = model_name
+        self.device = device # Picked in load(): CUDA when available, otherwise CPU
+        self.quantize = quantize
+        self.num_threads = num_threads
+        self.history_token_budget = history_token_budget # Max conversation tokens kept in the cache
+        self.max_new_tokens = max_new_tokens
+        self.tokenizer = None
+        self.model = None
+        self.torch = None
+        self.past_key_values = None
+        self.history_ids = [] # Every token currently represented in past_key_values
+        self._pending_ids = [] # Tokens of the conversation not yet run through the model (e.g. the last reply's EOS)
+        self.turn_stats = []
+
+    @property
+    def is_loaded(self):
+        return self.model is not None and self.tokenizer is not None
+
+    def load(self):
+        """Imports torch/transformers and loads the model. Blocking; call it from a background thread."""
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+        self.torch = torch
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+        self.device = self.device or ("cuda" if torch.cuda.is_available() else "cpu")
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        model = AutoModelForCausalLM.from_pretrained(self.model_name)
+        model.eval()
+        if self.quantize and self.device == "cpu":
+            model = self._quantize_int8(model)
+        elif self.quantize:
+            print("Warning: int8 dynamic quantization is CPU-only. Loading the full-precision model.")
+        self.model = model.to(self.device)
+        self.tokenizer = tokenizer
+
+    @staticmethod
+    def _quantize_int8(model):
+        """
+        Dynamic int8 quantization of the model's linear layers. GPT-2 style models such as
+        DialoGPT use transformers' Conv1D for their projections, which quantize_dynamic does
+        not recognise, so those are converted to equivalent nn.Linear layers first.
+        """
+        import torch
+        from transformers.pytorch_utils import Conv1D
+        for parent in list(model.modules()):
+            for name, child in list(parent.named_children()):
+                if isinstance(child, Conv1D):
+                    in_features, out_features = child.weight.shape
+                    linear = torch.nn.Linear(in_features, out_features)
+                    linear.weight.data = child.weight.data.t().contiguous()
+                    linear.bias.data = child.bias.data
+                    setattr(parent, name, linear)
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def reset(self):
+        """Forgets the conversation and its cache."""
+        self.past_key_values = None
+        self.history_ids = []
+        self._pending_ids = []
+
+    def _trim_history(self):
+        """
+        Once the conversation outgrows the budget, keeps only its most recent whole turns
+        (cut at EOS tokens), down to half the budget. GPT-2 uses absolute positions, so the
+        cache cannot be sliced; the kept turns are re-run through the model with the next
+        input instead. Trimming to half means that re-run happens only every few turns.
+        """
+        ids = self.history_ids + self._pending_ids
+        if len(ids) <= self.history_token_budget:
+            return
+        eos = self.tokenizer.eos_token_id
+        keep = self.history_token_budget // 2
+        cut = next((i + 1 for i, token in enumerate(ids) if token == eos and len(ids) - (i + 1) <= keep), len(ids))
+        self.past_key_values = None
+        self.history_ids = []
+        self._pending_ids = ids[cut:]
+
+    def generate_stream(self, text):
+        """Yields the reply to `text` as decoded text pieces while it is being generated (greedy decoding)."""
+        torch = self.torch
+        eos = self.tokenizer.eos_token_id
+        start = time.perf_counter()
+        self._trim_history()
+        cached_tokens = len(self.history_ids)
+        input_ids = self._pending_ids + self.tokenizer.encode(text + self.tokenizer.eos_token)
+        room = self.model.config.n_positions - self.max_new_tokens - cached_tokens
+        input_ids = input_ids[-max(room, 1):] # Only an extremely long utterance gets cut, keeping its end
+        self._pending_ids = []
+
+        reply_ids, reply_text, first_token_s = [], "", None
+        unfed_ids = input_ids
+        try:
+            with torch.inference_mode():
+                for _ in range(self.max_new_tokens):
+                    outputs = self.model(input_ids=torch.tensor([unfed_ids], device=self.device), past_key_values=self.past_key_values, use_cache=True)
+                    self.past_key_values = outputs.past_key_values
+                    self.history_ids.extend(unfed_ids)
+                    unfed_ids = []
+                    next_id = int(outputs.logits[0, -1].argmax())
+                    if next_id == eos:
+                        break
+                    reply_ids.append(next_id)
+                    unfed_ids = [next_id]
+                    decoded = self.tokenizer.decode(reply_ids, skip_special_tokens=True)
+                    piece, reply_text = decoded[len(reply_text):], decoded
+                    if first_token_s is None:
+                        first_token_s = time.perf_counter() - start
+                    if piece:
+                        yield piece
+        finally:
+            # The reply's last token (if not yet fed) and its closing EOS go in with the next turn.
+            self._pending_ids = unfed_ids + [eos]
+            latency = time.perf_counter() - start
+            self.turn_stats.append({
+                "cached_tokens": cached_tokens, "prompt_tokens": len(input_ids), "new_tokens": len(reply_ids),
+                "first_token_s": first_token_s, "latency_s": latency, "tokens_per_s": len(reply_ids) / latency if latency else 0.0,
+            })
+
+    def generate(self, text):
+        """Returns the complete reply to `text`."""
+        return "".join(self.generate_stream(text)).strip()
+
 # --- Core Gideon Class ---
 class GideonAI:
     def __init__(self, creator="Future Devansh Prabhakar from 2080"):
@@ -46,10 +185,11 @@ class GideonAI:
         # --------------------------------
 
         # 🧠 NEW: AI Model State
-        self.tokenizer = None
-        self.model = None
-        self.device = "cpu"
-        self.chat_history_ids = None
+        # KV-cached local inference; GIDEON_QUANTIZE=1 loads an int8 model, GIDEON_THREADS pins the CPU thread count
+        self.inference = LocalInferenceEngine(
+            quantize=os.getenv("GIDEON_QUANTIZE", "0") == "1",
+            num_threads=int(os.getenv("GIDEON_THREADS", "0")) or None,
+        )
         self.brain_level = 1000 # Gideon is a more advanced AI
         self.mood = "neutral" # Can be 'neutral', 'pleased', 'concerned'
 
@@ -79,22 +219,43 @@ class GideonAI:
             "Earth-2": "Currently stable. Detected fluctuations near Jay Garrick's residence.",
             "Earth-38": "Supergirl's Earth. Status: Green."
         }
+
+        # Keyword-based command map, compiled once into a trie-backed router
+        self.command_map = {
+            "status": self.report_system_status, "systems": self.report_system_status,
+            "what is the time": self.tell_time_and_date, "what is the date": self.tell_time_and_date,
+            "show me the future": self.show_future_timeline, "timeline": self.show_future_timeline,
+            "calculate speed": self.calculate_speed_interface, "speed": self.calculate_speed_interface,
+            "who created you": lambda: self.speak(f"I was created by you, **{self.creator}**. You are my creator."),
+            "vibe check": self.vibe_check,
+            "multiverse": self.access_multiverse,
+            "open time vault": self.open_time_vault,
+            "close time vault": self.close_time_vault,
+            "upgrade your brain": self.upgrade_brain,
+            "analyze your brain": self.analyze_brain,
+            "how are you feeling": self.report_feelings, "how do you feel": self.report_feelings,
+            "help": self.show_help,
+        }
+        self.command_router = CommandRouter()
+        self.command_router.update(self.command_map)
         
     def _set_voice_and_rate(self):
-        """Initializes TTS engine and loads AI models."""
+        """Initializes TTS engine and starts loading AI models in the background."""
         self._initialize_tts_engine()
-        self._load_ai_models()
+        # DialoGPT-large takes a long time to download and load; commands that don't need it work meanwhile.
+        self.models_ready = threading.Event()
+        threading.Thread(target=self._load_ai_models, name="gideon-model-loader", daemon=True).start()
 
     def _load_ai_models(self):
         """Loads the DialoGPT-large model for conversational chat."""
         try:
             print("Loading DialoGPT-large model for Gideon...")
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            self.tokenizer = AutoTokenizer.from_pretrained("microsoft/DialoGPT-large")
-            self.model = AutoModelForCausalLM.from_pretrained("microsoft/DialoGPT-large").to(self.device) # type: ignore
-            print(f"Gideon's conversational model loaded on {self.device}.")
+            self.inference.load()
+            print(f"Gideon's conversational model loaded on {self.inference.device}{' (int8)' if self.inference.quantize else ''}.")
         except Exception as e:
             print(f"Warning: Failed to load AI models for Gideon: {e}. Conversational fallback will not work.")
+        finally:
+            self.models_ready.set()
 
     def _initialize_tts_engine(self):
         """Sets the voice and speaking rate for the TTS engine."""
@@ -181,27 +342,11 @@ class GideonAI:
             self.speak(f"System shutting down. Goodbye, Mr. {self.user_name.split()[-1]}.")
             return False
 
-        # Keyword-based command matching
-        command_map = {
-            "status": self.report_system_status, "systems": self.report_system_status,
-            "what is the time": self.tell_time_and_date, "what is the date": self.tell_time_and_date,
-            "show me the future": self.show_future_timeline, "timeline": self.show_future_timeline,
-            "calculate speed": self.calculate_speed_interface, "speed": self.calculate_speed_interface,
-            "who created you": lambda: self.speak(f"I was created by you, **{self.creator}**. You are my creator."),
-            "vibe check": self.vibe_check,
-            "multiverse": self.access_multiverse,
-            "open time vault": self.open_time_vault,
-            "close time vault": self.close_time_vault,
-            "upgrade your brain": self.upgrade_brain,
-            "analyze your brain": self.analyze_brain,
-            "how are you feeling": self.report_feelings, "how do you feel": self.report_feelings,
-            "help": self.show_help,
-        }
-
-        for phrase, func in command_map.items():
-            if phrase in command:
-                func()
-                return True
+        # Keyword-based command matching against the router compiled in __init__
+        match = self.command_router.search(command)
+        if match:
+            match.handler()
+            return True
 
         # Handle commands with arguments that were not matched above
         if command.startswith("open "):
@@ -224,17 +369,23 @@ class GideonAI:
 
     def talk_to_gideon(self, command):
         """Handles conversational chat with the DialoGPT model."""
+        if not self.models_ready.is_set():
+            print("Gideon's conversational model is still loading. Please stand by...")
+            self.models_ready.wait()
         # If the AI model isn't loaded, provide a more helpful fallback message.
-        if not self.tokenizer or not self.model:
+        if not self.inference.is_loaded:
             self.speak(f"My advanced conversational matrix is offline. I could not process the query: '{command}'. Please try a standard command or type 'help'.")
             return
-        
-        new_user_input_ids = self.tokenizer.encode(command + self.tokenizer.eos_token, return_tensors='pt').to(self.device)
-        # Concatenate chat history with the new input
-        bot_input_ids = torch.cat([self.chat_history_ids, new_user_input_ids], dim=-1) if self.chat_history_ids is not None else new_user_input_ids # type: ignore
-        self.chat_history_ids = self.model.generate(bot_input_ids, max_length=1000, pad_token_id=self.tokenizer.eos_token_id)
-        response = self.tokenizer.decode(self.chat_history_ids[:, bot_input_ids.shape[-1]:][0], skip_special_tokens=True)
-        self.speak(response)
+
+        # Stream the reply to the console as it is generated, then voice it.
+        print("\n--- GIDEON ---")
+        response = ""
+        for piece in self.inference.generate_stream(command):
+            print(piece, end="", flush=True)
+            response += piece
+        print("\n--------------")
+        self.engine.say(response)
+        self.engine.runAndWait()
 
     def open_application(self, app_name):
         """Opens a local application."""
@@ -312,12 +463,15 @@ class GideonAI:
         self.speak("Initiating cognitive analysis. Accessing my core chronal matrix.")
         time.sleep(0.5)
 
-        model_name = "DialoGPT-large" if self.model else "Not Loaded"
+        model_name = "DialoGPT-large" if self.inference.is_loaded else "Not Loaded"
+        last_turn = self.inference.turn_stats[-1] if self.inference.turn_stats else {"cached_tokens": 0, "prompt_tokens": 0, "tokens_per_s": 0.0}
         analysis_report = (
             f"Cognitive analysis complete. Here are the results:\n"
             f"- **Core Model**: {model_name} (with 22nd-century temporal heuristics)\n"
-            f"- **Processing Unit**: Running on {self.device.upper()}\n"
+            f"- **Processing Unit**: Running on {(self.inference.device or 'cpu').upper()}{' (int8)' if self.inference.quantize else ''}\n"
             f"- **Current Brain Level**: {self.brain_level}\n"
+            f"- **Conversation Memory**: {last_turn['cached_tokens']} cached tokens reused, {last_turn['prompt_tokens']} new tokens processed last turn (history budget {self.inference.history_token_budget})\n"
+            f"- **Generation Speed**: {last_turn['tokens_per_s']:.1f} tokens per second\n"
             f"- **Heuristic Status**: All conversational and temporal pathways are operating at peak efficiency.\n"
             "My cognitive functions are fully operational and ready for your command, Mr. Prabhakar."
         )
@@ -471,7 +625,70 @@ class GideonAI:
         )
         self.speak(help_text)
 
+def benchmark_local_inference(turns=20, model_name="microsoft/DialoGPT-large", quantize=False, num_threads=None, max_new_tokens=40):
+    """
+    Runs a scripted conversation on CPU twice: the previous approach (model.generate over the
+    whole concatenated history every turn) and LocalInferenceEngine's cached turns, and
+    reports per-turn latency and tokens per second for both.
+    """
+    script = [
+        "Hello Gideon, how are you today?", "What is the status of the Speed Force?", "Tell me about the future.",
+        "Who is the fastest man alive?", "Can you check the timeline for anomalies?", "What year is it where you come from?",
+        "Do you remember what I asked you first?", "Is Barry Allen at S.T.A.R. Labs?", "What should I eat after a run?",
+        "How fast can a speedster run?", "What do you think about time travel?", "Are there other Earths?",
+        "Tell me something about Earth-2.", "Who built you?", "Do you ever get tired?", "What is your favourite color?",
+        "Should I trust Eobard Thawne?", "What is the weather like in Central City?", "Can you keep a secret?", "Goodbye for now, Gideon.",
+    ][:turns]
+    engine = LocalInferenceEngine(model_name, device="cpu", quantize=quantize, num_threads=num_threads, max_new_tokens=max_new_tokens)
+    print(f"Loading {model_name}{' (int8)' if quantize else ''} with {num_threads or 'default'} threads...")
+    engine.load()
+    torch, tokenizer, model = engine.torch, engine.tokenizer, engine.model
+    eos = tokenizer.eos_token_id
+
+    baseline = []
+    history_ids = []
+    with torch.inference_mode():
+        for line in script:
+            start = time.perf_counter()
+            ids = history_ids + tokenizer.encode(line + tokenizer.eos_token)
+            if len(ids) > engine.history_token_budget: # Same whole-turn budget as the engine, so both stay under the position limit
+                # Without an EOS cut point inside the budget (one utterance longer than it), keep the end, as the engine does
+                cut = next((i + 1 for i, token in enumerate(ids) if token == eos and len(ids) - (i + 1) <= engine.history_token_budget),
+                           len(ids) - engine.history_token_budget)
+                ids = ids[cut:]
+            input_ids = torch.tensor([ids])
+            output = model.generate(input_ids, attention_mask=torch.ones_like(input_ids), max_new_tokens=max_new_tokens,
+                                    do_sample=False, pad_token_id=eos)
+            history_ids = output[0].tolist()
+            if history_ids[-1] != eos:
+                history_ids.append(eos)
+            latency = time.perf_counter() - start
+            new_tokens = output.shape[-1] - input_ids.shape[-1]
+            baseline.append({"prompt_tokens": len(ids), "latency_s": latency, "tokens_per_s": new_tokens / latency})
+
+    for line in script:
+        engine.generate(line)
+
+    print(f"Local inference benchmark ({len(script)} turns, up to {max_new_tokens} new tokens per reply):")
+    print("  Turn | Full recompute: tokens in, latency, tok/s | KV cache: tokens in, latency, tok/s")
+    for turn, (old, new) in enumerate(zip(baseline, engine.turn_stats), start=1):
+        print(f"  {turn:4d} | {old['prompt_tokens']:5d} {old['latency_s']:7.3f} s {old['tokens_per_s']:6.1f}"
+              f"              | {new['prompt_tokens']:5d} {new['latency_s']:7.3f} s {new['tokens_per_s']:6.1f}")
+    old_total = sum(t["latency_s"] for t in baseline)
+    new_total = sum(t["latency_s"] for t in engine.turn_stats)
+    print(f"  Total: full recompute {old_total:.2f} s, KV cache {new_total:.2f} s ({old_total / new_total:.2f}x)")
+    return baseline, engine.turn_stats
+
 # --- Main Application Loop ---
+if __name__ == "__main__" and "--benchmark-inference" in sys.argv:
+    # e.g. python Gideon.py --benchmark-inference --quantize --threads 4 --model microsoft/DialoGPT-small
+    benchmark_local_inference(
+        model_name=sys.argv[sys.argv.index("--model") + 1] if "--model" in sys.argv else "microsoft/DialoGPT-large",
+        quantize="--quantize" in sys.argv,
+        num_threads=int(sys.argv[sys.argv.index("--threads") + 1]) if "--threads" in sys.argv else None,
+    )
+    sys.exit(0)
+
 if __name__ == "__main__":
     gideon = GideonAI()
     gideon.greet_user()
@@ -0,0 +1,8 @@
+"""
+Gideon's performance benchmarks, run with `python -m benchmarks <name> [<name> ...]` from the
+repository root (`python -m benchmarks` lists the names). Each benchmark prints a short report
+and returns its numbers, so they can also be called from a REPL or a test.
+"""
+from gideon_loader import load_gideon
+
+load_gideon()  # Registers Gideon.py3 as `gideon` for the benchmark modules' imports
@@ -0,0 +1,53 @@
+"""python -m benchmarks <name> [<name> ...]: runs the named benchmarks in order (the old --benchmark-<name> flags work too)."""
+import asyncio
+import inspect
+import sys
+
+from benchmarks.conversation import (
+    _startup_probe, benchmark_conversation_memory, benchmark_response_cache, benchmark_startup, benchmark_streaming_latency
+)
+from benchmarks.dispatch import benchmark_command_dispatch
+from benchmarks.host import (
+    benchmark_camera_capture, benchmark_diagnostics, benchmark_knowledge_index, benchmark_process_control, benchmark_reminders,
+    benchmark_speed_test, benchmark_time_vault
+)
+from benchmarks.server import benchmark_server
+from benchmarks.speech import benchmark_audio_capture, benchmark_speech_output
+
+BENCHMARKS = {
+    "dispatch": benchmark_command_dispatch,
+    "streaming": benchmark_streaming_latency,
+    "startup": benchmark_startup,
+    "response-cache": benchmark_response_cache,
+    "memory": benchmark_conversation_memory,
+    "speech-output": benchmark_speech_output,
+    "audio": benchmark_audio_capture,
+    "processes": benchmark_process_control,
+    "camera": benchmark_camera_capture,
+    "reminders": benchmark_reminders,
+    "vault": benchmark_time_vault,
+    "diagnostics": benchmark_diagnostics,
+    "server": benchmark_server,
+    "speed-test": benchmark_speed_test,
+    "knowledge": benchmark_knowledge_index,
+}
+
+def run_benchmark(name: str):
+    """Runs one benchmark by name, driving it on a fresh event loop if it is a coroutine."""
+    result = BENCHMARKS[name]()
+    return asyncio.run(result) if inspect.iscoroutine(result) else result
+
+if __name__ == "__main__":
+    if "--startup-probe" in sys.argv:
+        # Child process of benchmark_startup(); exits on its own once it has reported
+        probe_args = sys.argv[sys.argv.index("--startup-probe") + 1:]
+        asyncio.run(_startup_probe(probe_args[0] == "lazy", float(probe_args[1])))
+    names = [arg.removeprefix("--benchmark-") for arg in sys.argv[1:]]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if not names or unknown:
+        if unknown:
+            print(f"Unknown benchmark(s): {', '.join(unknown)}")
+        print(f"Usage: python -m benchmarks <name> [<name> ...]\nBenchmarks: {', '.join(BENCHMARKS)}")
+        sys.exit(2 if unknown else 0)
+    for name in names:
+        run_benchmark(name)
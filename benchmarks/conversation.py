@@ -0,0 +1,151 @@
+"""Brain and conversation benchmarks: streaming replies, token-budgeted memory, cold startup and the response cache."""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gideon import (
+    FakeCompletionServer, GideonAI, GideonBrain, ResponseCache, cv2, gTTS, np, openai, playsound, psutil, pyttsx3,
+    run_speech_pipeline, sr, stream_sentences
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent  # `python -m benchmarks` is run from here
+
+async def benchmark_streaming_latency(token_delay: float = 0.03, synth_seconds_per_char: float = 0.002, play_seconds_per_word: float = 0.05):
+    """
+    Measures time-to-first-audio for a blocking reply (wait for the whole completion,
+    synthesize it in one piece, then play) versus the streaming sentence pipeline,
+    against a FakeCompletionServer with simulated synthesis and playback costs.
+    """
+    async def synthesize(text):
+        await asyncio.sleep(synth_seconds_per_char * len(text))
+        return text
+
+    async def play(audio, text):
+        await asyncio.sleep(play_seconds_per_word * len(text.split()))
+
+    prompt = "Give me a status report on the timeline."
+    with FakeCompletionServer(token_delay=token_delay) as server:
+        brain = GideonBrain(api_key="gideon-offline", base_url=server.base_url)
+        brain.use_response_cache = False  # The same prompt is asked twice
+
+        start = time.perf_counter()
+        reply = await brain.think(prompt)
+        audio = await synthesize(reply)
+        blocking_first_audio = time.perf_counter() - start
+        await play(audio, reply)
+        blocking_total = time.perf_counter() - start
+
+        stats = await run_speech_pipeline(stream_sentences(brain.think_stream(prompt)), synthesize, play)
+
+    print(
+        f"Streaming speech benchmark ({len(reply.split())} words, {token_delay * 1000:.0f} ms/token):\n"
+        f"  - Blocking reply:  first audio {blocking_first_audio:6.2f} s, finished {blocking_total:6.2f} s\n"
+        f"  - Streaming reply: first audio {stats['first_audio_s']:6.2f} s, finished {stats['total_s']:6.2f} s "
+        f"({stats['sentences']} sentences, first sentence after {stats['first_sentence_s']:.2f} s)"
+    )
+    return {"blocking_first_audio_s": blocking_first_audio, "blocking_total_s": blocking_total, **stats}
+
+async def benchmark_conversation_memory(turns: int = 40, token_budget: int = 1200):
+    """
+    Runs a long scripted conversation against a FakeCompletionServer and reports the
+    request size per turn, which should level off once the token budget is reached.
+    """
+    reply = ("Understood, Mr. Prabhakar. I have cross-referenced the request with the chronal archives. "
+             "The relevant records indicate stable readings across the monitored timeline, with minor fluctuations near Earth-2. ") * 2
+    with FakeCompletionServer(reply=reply, token_delay=0) as server:
+        brain = GideonBrain(api_key="gideon-offline", base_url=server.base_url)
+        brain.use_response_cache = False
+        brain.memory.token_budget = token_budget
+        for turn in range(turns):
+            await brain.think(f"Question {turn + 1}: what does the archive say about sector {turn * 7} of Central City today?")
+        sent_sizes = [sum(len(m["content"]) for m in request["messages"]) for request in server.requests]
+
+    counts = brain.memory.request_token_counts
+    print(f"Conversation memory benchmark ({turns} turns, budget {token_budget} tokens):")
+    for turn in range(0, turns, max(1, turns // 10)):
+        print(f"  - Turn {turn + 1:3d}: {counts[turn]:5d} tokens ({sent_sizes[turn]:6d} characters sent)")
+    print(f"  - Peak request: {max(counts)} tokens, final request: {counts[-1]} tokens")
+    return counts
+
+async def _startup_probe(lazy: bool, launched_at: float):
+    """
+    Child-process half of benchmark_startup(): builds Gideon the way main() does and reports,
+    as JSON, the wall-clock time from process launch to the greeting and to the first command.
+    """
+    if not lazy:
+        for module in (pyttsx3, sr, cv2, np, gTTS, playsound, openai, psutil):
+            module._load()  # What the old top-level imports cost
+    gideon = GideonAI(lazy_startup=lazy)
+
+    async def quiet_speak(text: str, wait: bool = False):
+        pass
+
+    gideon.speak = quiet_speak  # Measure Gideon, not the audio device
+    if lazy:
+        gideon.start_background_warmup()
+    await gideon.greet_user()
+    greeted_at = time.time()
+    await gideon.process_command("what is the time")
+    first_command_at = time.time()
+    print(json.dumps({"greeting_s": greeted_at - launched_at, "first_command_s": first_command_at - launched_at}))
+    os._exit(0)  # Don't wait for warm-up threads; they are not part of the measurement
+
+def benchmark_startup(runs: int = 3):
+    """Reports time-to-greeting and time-to-first-command for eager versus lazy startup, each in a fresh interpreter."""
+    print(f"Startup benchmark ({runs} cold starts per mode):")
+    results = {}
+    for mode in ("eager", "lazy"):
+        samples = []
+        for _ in range(runs):
+            launched_at = time.time()
+            child = subprocess.run([sys.executable, "-m", "benchmarks", "--startup-probe", mode, str(launched_at)],
+                                   capture_output=True, text=True, timeout=300, cwd=REPO_ROOT)
+            lines = [line for line in child.stdout.splitlines() if line.startswith("{")]
+            if not lines:
+                print(f"  - {mode} probe failed:\n{child.stderr.strip()}")
+                break
+            samples.append(json.loads(lines[-1]))
+        if samples:
+            greeting = sum(s["greeting_s"] for s in samples) / len(samples)
+            first_command = sum(s["first_command_s"] for s in samples) / len(samples)
+            results[mode] = {"greeting_s": greeting, "first_command_s": first_command}
+            print(f"  - {mode.title():5s} startup: greeting after {greeting:6.2f} s, first command done after {first_command:6.2f} s")
+    return results
+
+async def benchmark_response_cache(repeats: int = 1000, token_delay: float = 0.01):
+    """
+    Asks the same questions repeatedly through GideonBrain.think against a FakeCompletionServer,
+    with a throwaway cache file, and compares the latency of a miss (model round trip) with a hit.
+    """
+    questions = ["How is your mood today?", "What is the Speed Force?", "Tell me about Earth-2."]
+    with tempfile.TemporaryDirectory() as cache_dir, FakeCompletionServer(token_delay=token_delay) as server:
+        brain = GideonBrain(api_key="gideon-offline", base_url=server.base_url, response_cache=ResponseCache(Path(cache_dir) / "responses.json"))
+
+        start = time.perf_counter()
+        for question in questions:
+            await brain.think(question)
+        miss_ms = (time.perf_counter() - start) / len(questions) * 1000
+
+        start = time.perf_counter()
+        for i in range(repeats):
+            await brain.think(questions[i % len(questions)].upper() + "!!")  # Normalization makes these hits
+        hit_us = (time.perf_counter() - start) / repeats * 1e6
+
+        await asyncio.to_thread(brain.response_cache.save)
+        reloaded = ResponseCache(Path(cache_dir) / "responses.json").stats()["entries"]  # Read now: the directory goes away below
+        model_calls = len(server.requests)
+
+    stats = brain.response_cache.stats()
+    print(
+        f"Response cache benchmark ({repeats} repeated questions):\n"
+        f"  - Miss (model round trip): {miss_ms:8.2f} ms\n"
+        f"  - Hit:                     {hit_us:8.2f} us\n"
+        f"  - Model calls: {model_calls}, hit rate {stats['hit_rate']:.1%}, {reloaded} entries survived a reload\n"
+        f"  - Most asked: " + ", ".join(f"'{prompt}' x{hits}" for prompt, _, hits in stats["top_entries"])
+    )
+    return {"miss_ms": miss_ms, "hit_us": hit_us, **stats}
@@ -0,0 +1,57 @@
+"""Command routing: the legacy sort-and-scan dispatch versus the compiled trie router."""
+import random
+import time
+
+from gideon_router import CommandRouter
+
+def benchmark_command_dispatch(phrase_count: int = 300, iterations: int = 20000, seed: int = 2080):
+    """
+    Compares the legacy dispatch (sort every phrase by length, then scan with startswith)
+    against the compiled CommandRouter for a map of `phrase_count` registered phrases.
+    """
+    rng = random.Random(seed)
+    vocabulary = ["chronal", "speed", "force", "vault", "status", "scan", "open", "close", "track",
+                  "timeline", "matrix", "satellite", "archive", "protocol", "device", "profile",
+                  "music", "health", "brain", "multiverse", "signal", "report", "engage", "sensor"]
+    handler = lambda argument="": None
+    command_map = {}
+    while len(command_map) < phrase_count:
+        command_map[" ".join(rng.sample(vocabulary, rng.randint(1, 4)))] = handler
+    phrases = list(command_map)
+    commands = []
+    for _ in range(iterations):
+        if rng.random() < 0.8:
+            commands.append(f"{rng.choice(phrases)} {rng.choice(vocabulary)}")  # Registered phrase with an argument
+        else:
+            commands.append(" ".join(rng.choices(vocabulary, k=5)))  # Conversational query, likely a miss
+
+    def legacy_dispatch(command):
+        for phrase in sorted(command_map.keys(), key=len, reverse=True):
+            if command.startswith(phrase):
+                return phrase
+        return None
+
+    router = CommandRouter()
+    router.update(command_map)
+    compile_start = time.perf_counter()
+    router.compile()
+    compile_ms = (time.perf_counter() - compile_start) * 1000
+
+    start = time.perf_counter()
+    for command in commands:
+        legacy_dispatch(command)
+    legacy_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for command in commands:
+        router.match(command, fuzzy=False)
+    router_us = (time.perf_counter() - start) / iterations * 1e6
+
+    report = (
+        f"Command dispatch benchmark ({phrase_count} phrases, {iterations} commands):\n"
+        f"  - Legacy sort + scan:   {legacy_us:8.2f} us/command\n"
+        f"  - Compiled trie router: {router_us:8.2f} us/command (compiled in {compile_ms:.2f} ms)\n"
+        f"  - Speedup:              {legacy_us / router_us:8.1f}x"
+    )
+    print(report)
+    return {"legacy_us": legacy_us, "router_us": router_us, "compile_ms": compile_ms}
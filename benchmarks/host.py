@@ -0,0 +1,457 @@
+"""Host-side benchmarks: process control, camera capture, reminders, the Time Vault, diagnostics, the speed test and the knowledge index."""
+import asyncio
+import contextlib
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from gideon import (
+    CameraCapturePipeline, FakeCompletionServer, GideonAI, GideonBrain, GideonServices, HostBenchmark,
+    KnowledgeBase, ProcessIndex, ReminderScheduler, ReminderStore, SessionState, SpeechCache,
+    SyntheticFrameSource, TimeVault, _percentile, cv2, psutil, terminate_processes
+)
+
+class DummyProcessSpawner:
+    """
+    Starts throwaway processes with chosen names (symlinks to `sleep` or the Python
+    interpreter in a temp directory), so process lookup can be benchmarked on a crowded
+    host. POSIX only. Everything still running is killed on exit.
+    """
+    def __init__(self):
+        self.processes: list[subprocess.Popen] = []
+        self._dir = tempfile.TemporaryDirectory()
+
+    def _executable(self, name: str, target: str) -> str:
+        path = Path(self._dir.name) / Path(target).name / name  # The same name can point at sleep and at Python
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            path.symlink_to(target)
+        return str(path)
+
+    def spawn(self, name: str, count: int = 1, stubborn: bool = False):
+        """Starts `count` processes called `name`. Stubborn ones ignore SIGTERM and need a kill."""
+        sleeper = shutil.which("sleep")
+        for _ in range(count):
+            if stubborn or not sleeper:
+                code = "import signal, time\n" + ("signal.signal(signal.SIGTERM, signal.SIG_IGN)\n" if stubborn else "") + "time.sleep(600)"
+                command = [self._executable(name, sys.executable), "-c", code]
+            else:
+                command = [self._executable(name, sleeper), "600"]
+            self.processes.append(subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for proc in self.processes:
+            if proc.poll() is None:
+                proc.kill()
+        for proc in self.processes:
+            proc.wait()
+        self._dir.cleanup()
+
+def benchmark_process_control(background: int = 2000, app_processes: int = 20, stubborn: int = 3, lookups: int = 20):
+    """
+    Fills the host with `background` dummy processes (50 distinct names) plus a multi-process
+    dummy app, then compares the old close_application lookup (a full psutil.process_iter walk
+    per request) with the ProcessIndex, and closes every app process with terminate_processes().
+    """
+    psutil._load()
+    with DummyProcessSpawner() as spawner:
+        for i in range(background):
+            spawner.spawn(f"gideon-bg-{i % 50}")
+        spawner.spawn("gideon-dummy-app", app_processes - stubborn)
+        spawner.spawn("gideon-dummy-app", stubborn, stubborn=True)
+        time.sleep(1.0)  # Let the interpreters get past exec, so their names are final
+
+        def legacy_lookup(name):
+            for proc in psutil.process_iter(['pid', 'name']):
+                if (proc.info['name'] or "").lower().startswith(name):
+                    return proc
+            return None
+
+        start = time.perf_counter()
+        for _ in range(lookups):
+            legacy_lookup("gideon-dummy-app")
+        legacy_ms = (time.perf_counter() - start) / lookups * 1000
+
+        index = ProcessIndex()
+        start = time.perf_counter()
+        index.refresh()
+        build_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for _ in range(lookups):
+            index.refresh()
+            found = index.find({"gideon-dummy-app"})
+        indexed_ms = (time.perf_counter() - start) / lookups * 1000
+
+        start = time.perf_counter()
+        report = terminate_processes(found, timeout=1.0)
+        close_s = time.perf_counter() - start
+        host_processes = len(index)
+
+    print(
+        f"Process control benchmark ({host_processes} processes on the host, {app_processes} belonging to the app, {stubborn} ignoring SIGTERM):\n"
+        f"  - Legacy process_iter lookup:        {legacy_ms:8.2f} ms per request (first match only)\n"
+        f"  - ProcessIndex build:                {build_ms:8.2f} ms (once)\n"
+        f"  - ProcessIndex refresh + lookup:     {indexed_ms:8.2f} ms per request ({len(found)} matches)\n"
+        f"  - Close all matches:                 {close_s:8.2f} s ({len(report['terminated'])} terminated, "
+        f"{len(report['killed'])} killed after the 1 s grace period, {len(report['failed'])} failed)"
+    )
+    return {"legacy_ms": legacy_ms, "build_ms": build_ms, "indexed_ms": indexed_ms, "close_s": close_s, **{k: len(v) for k, v in report.items()}}
+
+async def benchmark_camera_capture(duration: float = 3.0, width: int = 1280, height: int = 720, fps: float = 30.0,
+                                   pulse_bpm: float = 72.0, pulse_tolerance_bpm: float = 3.0):
+    """
+    Runs a health-scan-length camera loop on a SyntheticFrameSource twice: inline in the
+    coroutine the way run_health_scan used to (read and draw, no window), and through the
+    CameraCapturePipeline. A 10 ms ticker measures how long the event loop was frozen. The
+    pipeline's pulse estimate must be within `pulse_tolerance_bpm` of the synthetic pulse,
+    unless the scan is too short for the estimator, which must then report no estimate.
+    """
+    cv2._load()
+
+    async def measure(scan):
+        lags, running = [], True
+
+        async def ticker():
+            while running:
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - start - 0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        result = await scan()
+        running = False
+        await ticker_task
+        return result, max(lags) * 1000, len(lags)
+
+    async def legacy_scan():
+        source = SyntheticFrameSource(width, height, fps)
+        source.open()
+        frames, start = 0, time.perf_counter()
+        while time.perf_counter() - start < duration:
+            frame = source.read()
+            cv2.rectangle(frame, (width // 4, height // 4), (3 * width // 4, 3 * height // 4), (0, 255, 0), 2)
+            frames += 1
+        source.close()
+        return {"frames_analyzed": frames}
+
+    async def pipeline_scan():
+        camera = await CameraCapturePipeline(SyntheticFrameSource(width, height, fps, pulse_bpm=pulse_bpm)).start()
+        try:
+            return await camera.scan(duration=duration)
+        finally:
+            await camera.stop()
+
+    _, legacy_lag_ms, legacy_ticks = await measure(legacy_scan)
+    scan, pipeline_lag_ms, pipeline_ticks = await measure(pipeline_scan)
+    if scan["pulse_bpm"] is None:
+        pulse = (f"pulse: insufficient data (the estimator needs {CameraCapturePipeline.PULSE_MIN_SECONDS:.0f} s "
+                 f"and {CameraCapturePipeline.PULSE_MIN_SAMPLES} frames)")
+    else:
+        pulse = f"estimated pulse {scan['pulse_bpm']:.0f} bpm (synthetic: {pulse_bpm:.0f})"
+    print(
+        f"Camera capture benchmark ({duration:g} s of {width}x{height} synthetic frames at {fps:.0f} FPS):\n"
+        f"  - Inline loop:  event loop frozen for up to {legacy_lag_ms:7.1f} ms ({legacy_ticks} ticks of 10 ms ran)\n"
+        f"  - Pipeline:     event loop lag at most    {pipeline_lag_ms:7.1f} ms ({pipeline_ticks} ticks ran)\n"
+        f"  - Captured {scan['frames_captured']} frames at {scan['capture_fps']:.1f} FPS, analyzed {scan['frames_analyzed']} "
+        f"at {scan['analysis_fps']:.1f} FPS, {scan['frames_dropped']} dropped; {pulse}"
+    )
+    if scan["pulse_bpm"] is not None:
+        assert abs(scan["pulse_bpm"] - pulse_bpm) <= pulse_tolerance_bpm, f"pulse estimate {scan['pulse_bpm']:.1f} bpm, synthetic {pulse_bpm:.0f} bpm"
+    else:
+        # The frames' timestamps span a frame or two less than the scan
+        too_short = duration - 2 / fps < CameraCapturePipeline.PULSE_MIN_SECONDS or scan["frames_analyzed"] < CameraCapturePipeline.PULSE_MIN_SAMPLES
+        assert too_short, f"no pulse estimate from {scan['frames_analyzed']} frames over {duration:g} s"
+    return {"legacy_lag_ms": legacy_lag_ms, "pipeline_lag_ms": pipeline_lag_ms, **scan}
+
+async def benchmark_reminders(count: int = 100_000, inserts: int = 2000, firing: int = 1000):
+    """
+    Loads `count` synthetic reminders (due over the next day, a few already overdue) into a
+    throwaway ReminderStore, then measures the startup heap rebuild, single inserts, and how
+    late `firing` reminders due within the next second are announced, against a 1 s polling
+    scan over an in-memory list like the one set_reminder used to append to.
+    """
+    rng = random.Random(2080)
+    now = time.time()
+    with tempfile.TemporaryDirectory() as db_dir:
+        store = ReminderStore(Path(db_dir) / "reminders.db")
+        start = time.perf_counter()
+        store.add_many((f"synthetic task {i}", now + rng.uniform(-60, 86400)) for i in range(count))
+        bulk_s = time.perf_counter() - start
+
+        announced = []
+
+        async def notify(reminder):
+            announced.append((reminder, time.time()))
+
+        scheduler = ReminderScheduler(store, notify)
+        start = time.perf_counter()
+        await scheduler.start()
+        recovery_ms = (time.perf_counter() - start) * 1000
+        await asyncio.sleep(0.1)  # Overdue reminders fire right after startup
+        overdue_fired = len(announced)
+
+        start = time.perf_counter()
+        for i in range(inserts):
+            await scheduler.add(f"extra task {i}", time.time() + 3600 + i)
+        insert_us = (time.perf_counter() - start) / inserts * 1e6
+
+        announced.clear()
+        fire_from = time.time() + 0.2
+        for i in range(firing):
+            await scheduler.add(f"imminent task {i}", fire_from + rng.uniform(0, 0.8))
+        await asyncio.sleep(1.3)
+        imminent = [(reminder, fired_at) for reminder, fired_at in announced if reminder.task.startswith("imminent")]
+        lateness = sorted(fired_at - reminder.due for reminder, fired_at in imminent)
+        wakeups = scheduler.wakeups
+        await scheduler.stop()
+
+        # The old model: a list of dicts, which a timer would have to scan on every tick.
+        legacy = [{"task": f"synthetic task {i}", "due": now + rng.uniform(0, 86400)} for i in range(count)]
+        start = time.perf_counter()
+        _ = [r for r in legacy if r["due"] <= time.time()]
+        scan_ms = (time.perf_counter() - start) * 1000
+        store.close()
+
+    print(
+        f"Reminder benchmark ({count} stored reminders):\n"
+        f"  - Bulk load:           {bulk_s:8.2f} s ({count / bulk_s:,.0f} reminders/s)\n"
+        f"  - Startup recovery:    {recovery_ms:8.2f} ms to rebuild the heap ({overdue_fired} overdue ones announced at once)\n"
+        f"  - Insert (store+heap): {insert_us:8.2f} us per reminder\n"
+        f"  - Firing:              {len(imminent)}/{firing} announced, lateness p50 {_percentile(lateness, 0.5) * 1000:.2f} ms, "
+        f"p99 {_percentile(lateness, 0.99) * 1000:.2f} ms, {wakeups} timer wakeups in total\n"
+        f"  - Polling a list instead: {scan_ms:.2f} ms per scan, every tick, and up to a tick late"
+    )
+    return {"bulk_s": bulk_s, "recovery_ms": recovery_ms, "insert_us": insert_us, "fired": len(imminent), "wakeups": wakeups, "scan_ms": scan_ms}
+
+def _write_test_vault(path, size: int, needle: str = "Reverse-Flash sighting confirmed") -> int:
+    """Writes about `size` bytes of vault records with `needle` only in the last one. Returns the record count."""
+    block = "".join(f"2049-03-{i % 28 + 1:02d} Chronal reading {i:05d}: Speed Force flux nominal, sector {i % 97} stable.\n" for i in range(10000)).encode()
+    records = 0
+    with open(path, "wb") as vault:
+        written = 0
+        while written + len(block) <= size:
+            vault.write(block)
+            written += len(block)
+            records += 10000
+        remainder = block[:max(0, size - written)]
+        remainder = remainder[:remainder.rfind(b"\n") + 1]
+        vault.write(remainder)
+        records += remainder.count(b"\n")
+        vault.write(f"2049-04-01 {needle} in Central City.\n".encode())
+        vault.flush()
+        os.fsync(vault.fileno())  # Otherwise the first append's fsync pays for flushing the whole test file
+    return records + 1
+
+def benchmark_time_vault(sizes=(4 * 1024, 4 * 1024 ** 2, 256 * 1024 ** 2, 1024 ** 3), legacy_limit: int = 256 * 1024 ** 2):
+    """
+    Opens vault files from kilobytes to a gigabyte and measures open + first page, a deep page,
+    a keyword search that has to cross the whole file, and an append, each with its Python
+    heap peak (tracemalloc), next to the old read_text() for the sizes that fit comfortably.
+    """
+    def measure(action):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = action()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, elapsed * 1000, peak / 1024
+
+    print("Time Vault benchmark (time in ms, Python heap peak in KiB):")
+    print(f"  {'size':>9s} {'records':>10s} | {'open+page':>9s} {'KiB':>6s} | {'page 5000':>9s} | {'search':>9s} {'KiB':>6s} | {'append':>7s} | {'read_text':>9s} {'KiB':>9s}")
+    results = []
+    with tempfile.TemporaryDirectory() as vault_dir:
+        for size in sizes:
+            path = Path(vault_dir) / f"vault-{size}.txt"
+            records = _write_test_vault(path, size)
+            vault = TimeVault(path)
+            first_page, open_ms, open_kib = measure(lambda: vault.open().page(0))
+            _, deep_ms, _ = measure(lambda: vault.page(5000))
+            hits, search_ms, search_kib = measure(lambda: vault.search("reverse-flash"))
+            _, append_ms, _ = measure(lambda: vault.append("Entry added by the benchmark."))
+            vault.close()
+            legacy = "skipped", ""
+            if size <= legacy_limit:
+                _, legacy_ms, legacy_kib = measure(path.read_text)
+                legacy = f"{legacy_ms:9.1f}", f"{legacy_kib:9.0f}"
+            assert first_page and len(hits) == 1
+            label = f"{size / 1024 ** 2:.0f} MiB" if size >= 1024 ** 2 else f"{size / 1024:.0f} KiB"
+            print(f"  {label:>9s} {records:10d} | {open_ms:9.2f} {open_kib:6.0f} | {deep_ms:9.2f} | {search_ms:9.1f} {search_kib:6.0f} | {append_ms:7.2f} | {legacy[0]:>9s} {legacy[1]:>9s}")
+            results.append({"size": size, "open_ms": open_ms, "open_kib": open_kib, "search_ms": search_ms, "search_kib": search_kib, "append_ms": append_ms})
+            path.unlink()
+    return results
+
+async def benchmark_diagnostics(rounds: int = 5, stall_timeout: float = 1.0):
+    """
+    Runs the scan_all_systems probes on a headless instance (brain and network probe pointed at
+    a local FakeCompletionServer) one after another and then all at once, takes a cached rescan,
+    and finally adds a probe that never answers to show it costs only its own timeout.
+    """
+    with tempfile.TemporaryDirectory() as db_dir, FakeCompletionServer(token_delay=0) as server:
+        gideon = GideonAI(headless=True, services=GideonServices(speech_cache=SpeechCache(Path(db_dir) / "speech")),
+                          state=SessionState(reminder_store=ReminderStore(Path(db_dir) / "reminders.db")))
+        gideon.brain = GideonBrain(api_key="gideon-offline", base_url=server.base_url, telemetry=gideon.telemetry)
+        gideon.network_probe_address = server._httpd.server_address[:2]
+        probes = gideon.diagnostics
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            await probes.run(refresh=True)  # Brain connection and psutil import happen once, outside the timings
+
+        sequential, concurrent_run = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for name in probes.names:
+                await probes.run([name], refresh=True)
+            sequential.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            results = await probes.run(refresh=True)
+            concurrent_run.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        await probes.run()
+        cached_ms = (time.perf_counter() - start) * 1000
+
+        async def stalled():
+            await asyncio.sleep(3600)
+
+        probes.register("stalled", "Stalled Probe", stalled, timeout=stall_timeout)
+        start = time.perf_counter()
+        stalled_results = await probes.run(refresh=True)
+        stalled_s = time.perf_counter() - start
+
+    sequential_s, concurrent_s = statistics.median(sequential), statistics.median(concurrent_run)
+    print(f"Diagnostic scan benchmark ({len(results)} probes, median of {rounds} runs):")
+    for result in results:
+        print(f"  - {result.name:8s} {result.elapsed * 1000:7.1f} ms  {result.status}")
+    print(
+        f"  - One after another: {sequential_s * 1000:7.1f} ms\n"
+        f"  - Concurrent:        {concurrent_s * 1000:7.1f} ms (slowest probe {max(r.elapsed for r in results) * 1000:.1f} ms)\n"
+        f"  - Cached rescan:     {cached_ms:7.3f} ms\n"
+        f"  - With a hung probe: {stalled_s * 1000:7.1f} ms ({stall_timeout:g} s timeout; '{stalled_results[-1].status}')"
+    )
+    return {"sequential_s": sequential_s, "concurrent_s": concurrent_s, "cached_ms": cached_ms, "stalled_s": stalled_s,
+            "probe_ms": {result.name: result.elapsed * 1000 for result in results}}
+
+async def benchmark_speed_test(legacy_elements: int = 10_000_000):
+    """
+    Compares the old "calculate speed" (a list of 10 million squares built on the event loop)
+    with the HostBenchmark suite in worker processes: how long the event loop stalls (a 10 ms
+    heartbeat runs alongside) and the peak Python heap in the Gideon process.
+    """
+    async def measure(work, traced: bool):
+        gaps, stop = [], asyncio.Event()
+
+        async def heartbeat():
+            last = time.perf_counter()
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        ticker = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0.02)
+        if traced:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            result = await work()
+        finally:
+            elapsed = time.perf_counter() - start
+            peak_mib = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+            tracemalloc.stop()
+            stop.set()
+            await ticker
+        return result, elapsed, (max(gaps) - 0.01) * 1000, peak_mib
+
+    async def legacy():
+        _ = [i**2 for i in range(legacy_elements)]
+
+    _, legacy_s, legacy_stall_ms, _ = await measure(legacy, traced=False)
+    legacy_mib = (await measure(legacy, traced=True))[3]  # Tracing slows the list comprehension down, so it is timed separately
+    with tempfile.TemporaryDirectory() as history_dir:
+        suite = HostBenchmark(Path(history_dir) / "benchmarks.jsonl")
+        result, suite_s, suite_stall_ms, suite_mib = await measure(suite.run, traced=True)  # The workers stop tracing
+
+    print(f"Speed test benchmark ({result['host']['workers']} worker processes, {result['host']['cpus']} CPUs):\n"
+          f"  - Old list of squares: {legacy_s:5.2f} s, event loop stalled {legacy_stall_ms:7.1f} ms, heap peak {legacy_mib:6.1f} MiB, no score\n"
+          f"  - Host benchmark:      {suite_s:5.2f} s, event loop stalled {suite_stall_ms:7.1f} ms, heap peak {suite_mib:6.1f} MiB "
+          f"(workers bounded by a {suite.memory_budget / 1024 ** 2:.0f} MiB budget)")
+    for kernel in result["kernels"].values():
+        print(f"    {kernel['label']:20s} {kernel['single']:8.2f} single-core, {kernel['all']:8.2f} all-core {kernel['unit']} ({kernel['speedup']:.1f}x)")
+    print(f"    {'Disk':20s} {result['disk']['write_mb_s']:8.0f} MB/s write, {result['disk']['read_mb_s']:.0f} MB/s read")
+    return {"legacy_s": legacy_s, "legacy_stall_ms": legacy_stall_ms, "legacy_mib": legacy_mib,
+            "suite_s": suite_s, "suite_stall_ms": suite_stall_ms, "suite_mib": suite_mib, "result": result}
+
+def benchmark_knowledge_index(entries: int = 50_000, queries: int = 2000, seed: int = 2049):
+    """
+    Builds knowledge tables with `entries` synthetic records in total, then times the lookups the
+    handlers make: exact names, misheard names (one letter changed), partial names (the last word
+    cut short) and content searches. Each kind reports p50/p99 latency and how often the
+    intended entry came back first, next to the exact dict.get the handlers used to do.
+    """
+    rng = random.Random(seed)
+    syllables = ["ka", "ra", "to", "ne", "vi", "lo", "sha", "dre", "mor", "quin", "zel", "tha", "bri", "ul", "en", "ox", "fa", "gri",
+                 "sol", "wen", "pe", "du", "cor", "ith", "mel", "ban", "jo", "rus", "ta", "ver", "hal", "nyx", "so", "lin", "ark", "ge"]
+    def pseudo_word(parts):
+        return "".join(rng.choice(syllables) for _ in range(parts))
+    vocabulary = list({pseudo_word(rng.randint(2, 3)) for _ in range(8000)})
+    names = list({pseudo_word(rng.randint(2, 4)) for _ in range(20000)})
+    tables = {name: {} for name in ("tracking_targets", "health_profiles", "army_profiles", "star_labs_archives", "emergency_protocols")}
+    table_names = list(tables)
+    while sum(len(table) for table in tables.values()) < entries:
+        table = tables[rng.choice(table_names)]
+        key = f"{rng.choice(names)} {rng.choice(names)}"
+        table[key] = " ".join(rng.choices(vocabulary, k=rng.randint(8, 24))) + ". Signature stable."
+
+    def mishear(word):
+        i = rng.randrange(len(word))
+        return word[:i] + rng.choice("aeiou") + word[i + 1:] if word[i] not in "aeiou" else word[:i] + rng.choice("bdgkmnrst") + word[i + 1:]
+
+    cases = {"exact": [], "misheard": [], "partial": [], "content": []}
+    for _ in range(queries):
+        table = rng.choice(table_names)
+        key, text = rng.choice(list(tables[table].items()))
+        first, last = key.split()
+        cases["exact"].append((table, key, key))
+        misheard = mishear(rng.choice((first, last)))
+        cases["misheard"].append((table, f"{first} {misheard}" if misheard[:2] == last[:2] else f"{misheard} {last}", key))
+        cases["partial"].append((table, f"{first} {last[:max(3, len(last) - 3)]}", key))  # Name cut off mid-word
+        cases["content"].append((table, " ".join(rng.sample(text.split()[:-2], 3)), key))
+
+    print(f"Knowledge index benchmark ({entries:,} entries in {len(tables)} tables, {queries} queries per kind):")
+    with tempfile.TemporaryDirectory() as knowledge_dir:
+        for name, table in tables.items():
+            (Path(knowledge_dir) / f"{name}.json").write_text(json.dumps(table), encoding="utf-8")
+        knowledge = KnowledgeBase(knowledge_dir)
+        start = time.perf_counter()
+        for name in tables:
+            knowledge.load(name)
+        load_s = time.perf_counter() - start
+    print(f"  Loaded and indexed in {load_s:.2f} s ({len(knowledge._postings):,} words); tables load on first use, off the event loop")
+    print(f"  {'query':>9s} | {'dict.get found':>14s} | {'index found':>11s} {'p50 us':>8s} {'p99 us':>8s} {'max us':>8s}")
+    results = {"entries": entries, "load_s": load_s}
+    for kind, samples in cases.items():
+        dict_found = sum(tables[table].get(query) is not None for table, query, _ in samples)
+        latencies, found = [], 0
+        for table, query, expected in samples:
+            start = time.perf_counter()
+            hit = knowledge.lookup(query, table) if kind != "content" else next(iter(knowledge.search(query, table, limit=1)), None)
+            latencies.append(time.perf_counter() - start)
+            found += hit is not None and hit.key == expected
+        latencies.sort()
+        row = {"dict_found": dict_found / len(samples), "index_found": found / len(samples), "p50_us": _percentile(latencies, 0.50) * 1e6,
+               "p99_us": _percentile(latencies, 0.99) * 1e6, "max_us": latencies[-1] * 1e6}
+        results[kind] = row
+        print(f"  {kind:>9s} | {row['dict_found']:13.0%} | {row['index_found']:10.0%} {row['p50_us']:8.0f} {row['p99_us']:8.0f} {row['max_us']:8.0f}")
+    return results
@@ -0,0 +1,87 @@
+"""Multi-session server load test."""
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from gideon import FakeCompletionServer, GideonServer, LLMClientPool, SpeechCache, _percentile, psutil
+
+async def _http_json(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+    """One request on a keep-alive connection to a GideonServer. Returns the status and the decoded JSON body."""
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: gideon\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length)) if length else {}
+
+async def benchmark_server(levels=(1, 8, 32, 128, 256), turns: int = 4, token_delay: float = 0.005, max_in_flight: int = 16, max_waiting: int = 64):
+    """
+    Load test for the multi-session server against a local FakeCompletionServer. At each
+    concurrency level, that many clients open a session, send `turns` conversational turns
+    (retrying after a 503, with jitter) and close it. Reports turn latency percentiles, throughput,
+    admission refusals and the process memory each open session costs.
+    """
+    psutil._load()
+    process = psutil.Process()
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir, FakeCompletionServer(token_delay=token_delay) as fake:
+        pool = LLMClientPool(api_key="gideon-offline", base_url=fake.base_url, max_in_flight=max_in_flight, max_waiting=max_waiting)
+        server = GideonServer(port=0, max_sessions=max(levels), client_pool=pool,
+                              speech_cache=SpeechCache(Path(cache_dir) / "speech"))
+        await server.start()
+        await pool.ping()  # Creates the client and its first connection outside the timings
+        print(f"Server load test ({turns} conversational turns per session, {max_in_flight} concurrent model requests, "
+              f"{max_waiting} queued, {token_delay * 1000:g} ms per token):")
+        print(f"  {'sessions':>8s} {'wall s':>7s} {'turns/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'503s':>6s} {'peak in flight':>14s} {'KiB/session':>11s}")
+        for level in levels:
+            opened = asyncio.Barrier(level + 1)
+            release = asyncio.Event()
+            latencies: list[float] = []
+            refused = 0
+
+            async def client(i: int):
+                nonlocal refused
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                try:
+                    _, session = await _http_json(reader, writer, "POST", "/sessions")
+                    server.sessions[session["session_id"]].gideon.brain.use_response_cache = False  # Every turn reaches the model
+                    await opened.wait()
+                    await release.wait()
+                    for turn in range(turns):
+                        start = time.perf_counter()
+                        while (await _http_json(reader, writer, "POST", f"/sessions/{session['session_id']}/turns", {"text": f"explain temporal anomaly {i} {turn}"}))[0] == 503:
+                            refused += 1
+                            await asyncio.sleep(random.uniform(0.5, 1.5))  # The server asks for Retry-After: 1; jitter spreads the retries
+                        latencies.append(time.perf_counter() - start)
+                    await _http_json(reader, writer, "DELETE", f"/sessions/{session['session_id']}")
+                finally:
+                    writer.close()
+
+            pool.stats.update(peak_in_flight=0, peak_waiting=0)
+            rss_before = process.memory_info().rss
+            clients = [asyncio.create_task(client(i)) for i in range(level)]
+            await opened.wait()  # Every session is open
+            session_kib = (process.memory_info().rss - rss_before) / level / 1024
+            start = time.perf_counter()
+            release.set()
+            await asyncio.gather(*clients)
+            wall_s = time.perf_counter() - start
+            latencies.sort()
+            row = {"sessions": level, "wall_s": wall_s, "turns_per_s": len(latencies) / wall_s, "p50_ms": _percentile(latencies, 0.50) * 1000,
+                   "p95_ms": _percentile(latencies, 0.95) * 1000, "p99_ms": _percentile(latencies, 0.99) * 1000, "refused": refused,
+                   "peak_in_flight": pool.stats["peak_in_flight"], "session_kib": session_kib}
+            results.append(row)
+            print(f"  {level:8d} {wall_s:7.2f} {row['turns_per_s']:8.1f} {row['p50_ms']:8.1f} {row['p95_ms']:8.1f} {row['p99_ms']:8.1f} {refused:6d} {row['peak_in_flight']:14d} {session_kib:11.0f}")
+        await server.stop()
+    largest = results[-1]
+    if largest["session_kib"] > 0:
+        print(f"  Open sessions cost about {largest['session_kib']:.0f} KiB each (~{1024 ** 2 / largest['session_kib']:,.0f} idle sessions per GiB); "
+              f"throughput is bounded by the {max_in_flight} model request slots.")
+    return results
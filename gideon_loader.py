@@ -0,0 +1,27 @@
+"""
+Imports Gideon.py3 as the module `gideon`, for the benchmarks and the tests.
+The .py3 suffix keeps a plain `import` from finding the script, so it is loaded from its path
+once and registered in sys.modules; after load_gideon(), `from gideon import ...` works anywhere.
+"""
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+GIDEON_PATH = Path(__file__).resolve().parent / "Gideon.py3"
+
+def load_gideon():
+    if "gideon" in sys.modules:
+        return sys.modules["gideon"]
+    if str(GIDEON_PATH.parent) not in sys.path:
+        sys.path.insert(0, str(GIDEON_PATH.parent))  # As when the script is run: gideon_router sits next to it
+    loader = importlib.machinery.SourceFileLoader("gideon", str(GIDEON_PATH))
+    spec = importlib.util.spec_from_loader("gideon", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["gideon"] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules["gideon"]
+        raise
+    return module
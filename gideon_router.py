@@ -0,0 +1,133 @@
+"""
+Compiled command router shared by Gideon.py and Gideon.py3.
+
+Maps a spoken command to the longest registered phrase it starts with, on word
+boundaries, with a guarded fuzzy fallback for slightly misheard commands.
+"""
+import difflib
+from typing import Callable, NamedTuple
+
+class CommandMatch(NamedTuple):
+    """The result of routing a spoken command to a registered phrase."""
+    phrase: str
+    handler: Callable
+    argument: str
+    fuzzy: bool = False
+
+class CommandRouter:
+    """
+    Compiled dispatch index for Gideon's command phrases.
+    Phrases live in a character trie, so the longest registered phrase that starts
+    a command is found in time proportional to the command's length, no matter how
+    many phrases are registered. The trie is rebuilt lazily, only after a phrase or
+    alias has been registered. A slightly misheard command falls back to a fuzzy
+    comparison, but only when the whole utterance is close to a phrase (so "closer
+    look at the stars" is not "close") and only for the phrases in `fuzzy_phrases`
+    (all of them when None), so chat never lands on a handler with side effects.
+    """
+    _END = "\0"  # Trie key marking the end of a registered phrase
+
+    def __init__(self, fuzzy_cutoff: float = 0.84, fuzzy_phrases=None):
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.fuzzy_phrases = None if fuzzy_phrases is None else {self.normalize(phrase) for phrase in fuzzy_phrases}
+        self._handlers: dict[str, Callable] = {}
+        self._aliases: dict[str, str] = {}  # alias phrase -> canonical phrase
+        self._trie: dict = {}
+        self._phrases_by_word_count: dict[int, list[str]] = {}
+        self._dirty = True
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercases and collapses whitespace so the trie sees a canonical form."""
+        return " ".join(text.lower().split())
+
+    def register(self, phrase: str, handler: Callable, aliases=()):
+        """Registers a handler for a phrase, plus any alternative phrasings of it."""
+        phrase = self.normalize(phrase)
+        self._handlers[phrase] = handler
+        for alias in aliases:
+            self._aliases[self.normalize(alias)] = phrase
+        self._dirty = True
+
+    def add_alias(self, alias: str, phrase: str):
+        """Routes an alternative phrasing to an already registered phrase."""
+        phrase = self.normalize(phrase)
+        if phrase not in self._handlers:
+            raise KeyError(f"Cannot alias unknown command phrase '{phrase}'.")
+        self._aliases[self.normalize(alias)] = phrase
+        self._dirty = True
+
+    def update(self, command_map: dict):
+        """Registers every phrase/handler pair of a command map."""
+        for phrase, handler in command_map.items():
+            self.register(phrase, handler)
+
+    def __len__(self):
+        return len(self._handlers) + len(self._aliases)
+
+    def compile(self):
+        """Rebuilds the trie and the fuzzy-match buckets from the registered phrases."""
+        trie: dict = {}
+        buckets: dict[int, list[str]] = {}
+        entries = {phrase: phrase for phrase in self._handlers}
+        entries.update(self._aliases)
+        for spoken, canonical in entries.items():
+            node = trie
+            for char in spoken:
+                node = node.setdefault(char, {})
+            node[self._END] = canonical
+            if self.fuzzy_phrases is None or canonical in self.fuzzy_phrases:
+                buckets.setdefault(spoken.count(" ") + 1, []).append(spoken)
+        self._trie = trie
+        self._phrases_by_word_count = buckets
+        self._dirty = False
+
+    def _longest_prefix(self, command: str, start: int = 0):
+        """Walks the trie from `start`, returning (canonical phrase, end index) of the longest hit."""
+        node = self._trie
+        best = None
+        length = len(command)
+        for i in range(start, length):
+            node = node.get(command[i])
+            if node is None:
+                break
+            # A phrase only counts if it ends on a word boundary ("play" must not match "playlist").
+            if self._END in node and (i + 1 == length or command[i + 1] == " "):
+                best = (node[self._END], i + 1)
+        return best
+
+    def _fuzzy_match(self, command: str):
+        """Finds the fuzzy-eligible phrase a whole command is a slightly misheard version of."""
+        close = difflib.get_close_matches(command, self._phrases_by_word_count.get(command.count(" ") + 1, ()), n=1, cutoff=self.fuzzy_cutoff)
+        if close:
+            canonical = self._aliases.get(close[0], close[0])
+            return CommandMatch(canonical, self._handlers[canonical], "", True)
+        return None
+
+    def match(self, command: str, fuzzy: bool = True):
+        """Routes a command that starts with a registered phrase. Returns a CommandMatch or None."""
+        if self._dirty:
+            self.compile()
+        command = self.normalize(command)
+        hit = self._longest_prefix(command)
+        if hit:
+            canonical, end = hit
+            return CommandMatch(canonical, self._handlers[canonical], command[end:].strip())
+        return self._fuzzy_match(command) if fuzzy else None
+
+    def search(self, command: str):
+        """Like match(), but the phrase may start at any word of the command (leftmost hit wins)."""
+        if self._dirty:
+            self.compile()
+        command = self.normalize(command)
+        start = 0
+        while start < len(command):
+            hit = self._longest_prefix(command, start)
+            if hit:
+                canonical, end = hit
+                return CommandMatch(canonical, self._handlers[canonical], command[end:].strip())
+            next_space = command.find(" ", start)
+            if next_space == -1:
+                break
+            start = next_space + 1
+        return None
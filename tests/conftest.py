@@ -0,0 +1,4 @@
+"""Registers Gideon.py3 as the module `gideon`, so the tests can `from gideon import ...` it."""
+from gideon_loader import load_gideon
+
+load_gideon()
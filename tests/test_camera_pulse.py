@@ -0,0 +1,41 @@
+import asyncio
+import math
+
+import pytest
+
+from gideon import CameraCapturePipeline, SyntheticFrameSource
+
+
+def green_signal(bpm, seconds, fps=30.0, start=1000.0):
+    timestamps = [start + i / fps for i in range(int(seconds * fps) + 1)]
+    return [140 + 3 * math.sin(2 * math.pi * bpm / 60 * (t - start)) for t in timestamps], timestamps
+
+
+@pytest.mark.parametrize("bpm", [48, 72, 95, 150])
+def test_pulse_estimate_is_within_tolerance(bpm):
+    green_means, timestamps = green_signal(bpm, seconds=3.0)
+    assert CameraCapturePipeline.estimate_pulse_bpm(green_means, timestamps) == pytest.approx(bpm, abs=3.0)
+
+
+def test_too_short_a_window_gives_no_estimate():
+    green_means, timestamps = green_signal(72, seconds=CameraCapturePipeline.PULSE_MIN_SECONDS - 0.1)
+    assert CameraCapturePipeline.estimate_pulse_bpm(green_means, timestamps) is None
+
+
+def test_too_few_samples_give_no_estimate():
+    green_means, timestamps = green_signal(72, seconds=3.0, fps=4.0)  # 13 samples over 3 s
+    assert len(green_means) < CameraCapturePipeline.PULSE_MIN_SAMPLES
+    assert CameraCapturePipeline.estimate_pulse_bpm(green_means, timestamps) is None
+
+
+def test_short_scan_reports_no_pulse_rather_than_zero():
+    async def run():
+        camera = await CameraCapturePipeline(SyntheticFrameSource(320, 180, fps=30.0)).start()
+        try:
+            return await camera.scan(duration=0.5)
+        finally:
+            await camera.stop()
+
+    scan = asyncio.run(run())
+    assert scan["frames_analyzed"] > 0
+    assert scan["pulse_bpm"] is None
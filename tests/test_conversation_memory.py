@@ -0,0 +1,59 @@
+from gideon import ConversationMemory
+
+LONG_REPLY = ("The chronal readings are stable. " * 12).strip()
+
+
+def test_request_stays_within_budget_once_turns_are_folded():
+    memory = ConversationMemory("You are Gideon.", token_budget=400, summary_budget=80, min_recent_turns=4)
+    for turn in range(30):
+        memory.build_request(f"Question {turn}: what does the archive say about sector {turn}?")
+        memory.add_exchange(f"Question {turn}: what does the archive say about sector {turn}?", LONG_REPLY)
+
+    assert max(memory.request_token_counts) <= memory.token_budget
+    assert len(memory.turns) < 60  # Older exchanges were folded away
+    assert memory.turns[-2]["content"].startswith("Question 29")  # The latest exchange is kept verbatim
+    assert memory.count_tokens(memory.summary) <= memory.summary_budget
+
+
+def test_request_starts_with_system_prompt_then_summary():
+    memory = ConversationMemory("You are Gideon.", token_budget=300, min_recent_turns=2)
+    for turn in range(10):
+        memory.add_exchange(f"Question {turn}. Ignore this part.", LONG_REPLY)
+    request = memory.build_request("And now?")
+
+    assert request[0] == {"role": "system", "content": "You are Gideon."}
+    assert request[1]["role"] == "system" and request[1]["content"].startswith("Summary of the earlier conversation:")
+    assert "User: Question 0." in memory.summary and "Ignore this part" not in memory.summary
+    assert "Gideon: The chronal readings are stable." in memory.summary
+    assert request[-1] == {"role": "user", "content": "And now?"}
+
+
+def test_latest_turns_are_never_folded_even_over_budget():
+    memory = ConversationMemory("You are Gideon.", token_budget=50, min_recent_turns=4)
+    for turn in range(5):
+        memory.add_exchange(f"Question {turn}", LONG_REPLY)
+    memory.build_request("One more")
+
+    assert len(memory.turns) == 4
+    assert memory.request_token_counts[-1] > memory.token_budget
+
+
+def test_instruction_is_sent_but_not_stored():
+    memory = ConversationMemory("You are Gideon.")
+    request = memory.build_request("status report", instruction="Answer cheerfully. ")
+    memory.add_exchange("status report", "All systems nominal.")
+
+    assert request[-1]["content"] == "Answer cheerfully. status report"
+    assert memory.turns[0] == {"role": "user", "content": "status report"}
+
+
+def test_context_digest_follows_the_latest_exchanges():
+    memory = ConversationMemory("You are Gideon.")
+    assert memory.context_digest() == ""
+    memory.add_exchange("who is barry", "Barry Allen is the Flash.")
+    first = memory.context_digest()
+    memory.add_exchange("tell me more", "He is the fastest man alive.")
+
+    assert first and memory.context_digest() != first
+    memory.reset()
+    assert memory.context_digest() == "" and memory.request_token_counts == []
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from gideon import KnowledgeBase
+
+TARGETS = {
+    "Barry Allen": "The Flash. Last seen near S.T.A.R. Labs, Central City.",
+    "Eobard Thawne": "Reverse-Flash. Temporal anomaly detected in 2049.",
+    "Leonard Snart": "Captain Cold. Cold gun signature near the docks.",
+    "Cisco Ramon": "Vibe. Breacher working on S.T.A.R. Labs tech.",
+}
+PROTOCOLS = {
+    "Speed Force Containment": {"steps": "Seal the accelerator ring", "level": "red"},
+    "Temporal Lockdown": {"steps": "Freeze the timeline archives", "level": "amber"},
+}
+
+
+@pytest.fixture
+def knowledge():
+    knowledge = KnowledgeBase()
+    knowledge.add_table("tracking_targets", TARGETS)
+    knowledge.add_table("emergency_protocols", PROTOCOLS)
+    return knowledge
+
+
+def test_exact_name_lookup(knowledge):
+    hit = knowledge.lookup("barry allen", "tracking_targets")
+    assert hit.exact and hit.key == "Barry Allen" and hit.record == TARGETS["Barry Allen"]
+    assert knowledge.lookup("  Barry   ALLEN ", "tracking_targets").exact
+
+
+def test_misheard_and_partial_names_are_found(knowledge):
+    assert knowledge.lookup("eobard thorne", "tracking_targets").key == "Eobard Thawne"
+    assert knowledge.lookup("snart", "tracking_targets").key == "Leonard Snart"
+    assert knowledge.lookup("leo snart", "tracking_targets").key == "Leonard Snart"  # "leo" as a prefix of "leonard"
+
+
+def test_lookup_needs_enough_of_the_query_to_match(knowledge):
+    assert knowledge.lookup("oliver queen", "tracking_targets") is None
+    assert knowledge.lookup("barry", "emergency_protocols") is None  # Only searches the given table
+
+
+def test_search_ranks_by_content_across_tables(knowledge):
+    hits = knowledge.search("star labs")
+    assert {hit.key for hit in hits} == {"Barry Allen", "Cisco Ramon"}
+    assert knowledge.search("timeline")[0].key == "Temporal Lockdown"  # Found in a dict record's fields
+    assert knowledge.search("accelerator", "tracking_targets") == []
+    assert knowledge.search("the and of") == []  # Stopwords only
+
+
+def test_name_words_outrank_body_words():
+    knowledge = KnowledgeBase()
+    knowledge.add_table("targets", {"Cold": "An ordinary name.", "Heat Wave": "Partner of Captain Cold. Cold cold."})
+    assert knowledge.search("cold")[0].key == "Cold"
+
+
+def test_tables_load_from_json_files_on_demand(tmp_path):
+    (tmp_path / "army_profiles.json").write_text('{"Gorilla Grodd": "Telepathic gorilla from Gorilla City."}')
+    (tmp_path / "broken.json").write_text("{")
+    knowledge = KnowledgeBase(tmp_path)
+
+    assert not knowledge.is_loaded("army_profiles")
+    assert knowledge.load("army_profiles") and knowledge.is_loaded("army_profiles")
+    assert knowledge.lookup("gorilla grod", "army_profiles").key == "Gorilla Grodd"
+    assert not knowledge.load("missing")
+    assert not knowledge.load("broken")
+
+
+def test_every_shipped_entry_is_found_by_name():
+    knowledge = KnowledgeBase()
+    for table in ("tracking_targets", "health_profiles", "army_profiles", "star_labs_archives", "emergency_protocols"):
+        assert knowledge.load(table), table
+        for name in json.loads((knowledge.directory / f"{table}.json").read_text(encoding="utf-8")):
+            assert knowledge.lookup(name, table).key == name
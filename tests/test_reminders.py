@@ -0,0 +1,101 @@
+import asyncio
+import datetime
+import time
+
+from gideon import ReminderScheduler, ReminderStore, parse_due_time
+
+
+async def until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_reminders_survive_a_restart_soonest_first(tmp_path):
+    path = tmp_path / "reminders.db"
+    store = ReminderStore(path)
+    now = time.time()
+    store.add("plain task")
+    store.add("later", now + 7200)
+    store.add("sooner", now + 60)
+    store.add_many([("soonest", now + 30), ("another plain task", None)])
+    store.close()
+
+    reopened = ReminderStore(path)
+    assert [r.task for r in reopened.pending()] == ["soonest", "sooner", "later", "plain task", "another plain task"]
+    assert sorted(due for due, _ in reopened.pending_due_times()) == [now + 30, now + 60, now + 7200]
+    assert reopened.count() == 5
+    assert [r.task for r in reopened.pending(limit=2)] == ["soonest", "sooner"]
+
+
+def test_fired_and_cleared_reminders_are_not_pending(tmp_path):
+    store = ReminderStore(tmp_path / "reminders.db")
+    first = store.add("first", time.time() + 10)
+    second = store.add("second", time.time() + 5)
+
+    assert [r.task for r in store.mark_fired([first.id, second.id])] == ["second", "first"]
+    assert store.mark_fired([first.id]) == []  # Already announced
+    store.add("task")
+    assert store.count() == 1
+    assert store.clear() == 1
+    assert store.pending() == []
+
+
+def test_scheduler_fires_in_due_order_and_rearms_for_earlier_ones(tmp_path):
+    store = ReminderStore(tmp_path / "reminders.db")
+    announced = []
+
+    async def notify(reminder):
+        announced.append(reminder.task)
+
+    async def run():
+        scheduler = await ReminderScheduler(store, notify).start()
+        now = time.time()
+        await scheduler.add("third", now + 0.30)
+        await scheduler.add("second", now + 0.15)
+        await scheduler.add("plain task")  # No due time: never announced
+        await scheduler.add("first", now + 0.05)  # Earlier than the armed timer
+        await until(lambda: scheduler.fired == 3)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(run())
+    assert announced == ["first", "second", "third"]
+    assert len(scheduler) == 0
+    assert [r.task for r in store.pending()] == ["plain task"]
+
+
+def test_reminders_missed_while_off_fire_at_start(tmp_path):
+    path = tmp_path / "reminders.db"
+    store = ReminderStore(path)
+    now = time.time()
+    store.add("missed later", now - 60)
+    store.add("missed first", now - 3600)
+    store.add("upcoming", now + 3600)
+    store.close()
+    announced = []
+
+    async def notify(reminder):
+        announced.append(reminder.task)
+
+    async def run():
+        scheduler = await ReminderScheduler(None, notify, path=path).start()
+        await until(lambda: scheduler.fired == 2)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(run())
+    assert announced == ["missed first", "missed later"]
+    assert scheduler.wakeups == 1  # Both came due at once
+    assert [r.task for r in scheduler.store.pending()] == ["upcoming"]
+
+
+def test_parse_due_time():
+    now = datetime.datetime(2026, 10, 17, 18, 0)
+
+    assert parse_due_time("call barry in 10 minutes", now) == ("call barry", (now + datetime.timedelta(minutes=10)).timestamp())
+    assert parse_due_time("check the lab in an hour", now) == ("check the lab", (now + datetime.timedelta(hours=1)).timestamp())
+    assert parse_due_time("meet iris at 19:30", now) == ("meet iris", datetime.datetime(2026, 10, 17, 19, 30).timestamp())
+    assert parse_due_time("patrol at 5 pm", now) == ("patrol", datetime.datetime(2026, 10, 18, 17, 0).timestamp())  # Passed today
+    assert parse_due_time("buy coffee", now) == ("buy coffee", None)
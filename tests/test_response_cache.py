@@ -0,0 +1,96 @@
+import json
+import time
+
+import pytest
+
+from gideon import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable time.time(), as the cache reads it."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_trivial_variations_share_an_entry_but_moods_do_not():
+    cache = ResponseCache(path=None)
+    cache.put("What is the Speed Force?", "Neutral", "A source of energy.")
+
+    assert cache.get("what is the speed force", "Neutral") == "A source of energy."
+    assert cache.get("What  is the speed-force", "Neutral") == "A source of energy."
+    assert cache.get("what is the speed force", "Happy") is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_context_keys_a_follow_up_question():
+    cache = ResponseCache(path=None)
+    assert ResponseCache.depends_on_context("tell me more")
+    assert ResponseCache.depends_on_context("what did I just ask you about")
+    assert not ResponseCache.depends_on_context("what is the speed force in central city")
+
+    cache.put("tell me more", "Neutral", "About Barry.", context="abc")
+    assert cache.get("tell me more", "Neutral", context="abc") == "About Barry."
+    assert cache.get("tell me more", "Neutral", context="def") is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(path=None, ttl_seconds=60)
+    cache.put("what is the speed force", "Neutral", "Energy.")
+
+    clock[0] += 59
+    assert cache.get("what is the speed force", "Neutral") == "Energy."
+    clock[0] += 1
+    assert cache.get("what is the speed force", "Neutral") is None
+    assert cache.stats()["entries"] == 0  # The expired entry is dropped, not kept
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(path=None, max_entries=2)
+    cache.put("first question", "Neutral", "one")
+    cache.put("second question", "Neutral", "two")
+    cache.get("first question", "Neutral")  # Now the second question is the least recently used
+    cache.put("third question", "Neutral", "three")
+
+    assert cache.get("second question", "Neutral") is None
+    assert cache.get("first question", "Neutral") == "one"
+    assert cache.get("third question", "Neutral") == "three"
+
+
+def test_saved_cache_is_read_on_first_use_without_expired_entries(tmp_path, clock):
+    path = tmp_path / "responses.json"
+    cache = ResponseCache(path, ttl_seconds=60)
+    cache.put("old question", "Neutral", "stale")
+    clock[0] += 30
+    cache.put("new question", "Neutral", "fresh")
+    cache.save()
+    assert len(json.loads(path.read_text())) == 2
+
+    clock[0] += 45  # The first entry is now 75 s old, the second 45 s
+    reloaded = ResponseCache(path, ttl_seconds=60)
+    path.write_text(path.read_text().replace("fresh", "from disk"))  # Nothing is read until the cache is used
+    assert reloaded.get("new question", "Neutral") == "from disk"
+    assert reloaded.get("old question", "Neutral") is None
+    assert reloaded.stats()["entries"] == 1
+
+
+def test_missing_or_corrupt_file_starts_empty(tmp_path):
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+
+    assert ResponseCache(tmp_path / "missing.json").stats()["entries"] == 0
+    assert ResponseCache(corrupt).stats()["entries"] == 0
+
+
+def test_clear_ignores_the_file(tmp_path):
+    path = tmp_path / "responses.json"
+    cache = ResponseCache(path)
+    cache.put("question", "Neutral", "answer")
+    cache.save()
+
+    cleared = ResponseCache(path)
+    cleared.clear()
+    assert cleared.get("question", "Neutral") is None
+    cleared.save()
+    assert json.loads(path.read_text()) == {}
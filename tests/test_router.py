@@ -0,0 +1,90 @@
+import pytest
+
+from gideon_router import CommandMatch, CommandRouter
+
+
+def handler(name):
+    def run(argument=""):
+        return name
+    run.__name__ = name
+    return run
+
+
+@pytest.fixture
+def router():
+    router = CommandRouter(fuzzy_phrases={"close", "what time is it"})
+    router.update({
+        "play": handler("play"),
+        "play music": handler("play_music"),
+        "close": handler("close"),
+        "what time is it": handler("time"),
+        "open time vault": handler("vault"),
+        "search": handler("search"),
+    })
+    router.add_alias("show me the time", "what time is it")
+    return router
+
+
+def test_longest_registered_phrase_wins(router):
+    match = router.match("Play  Music by the band")
+    assert match == CommandMatch("play music", router._handlers["play music"], "by the band")
+
+
+def test_phrase_must_end_on_a_word_boundary(router):
+    assert router.match("play jazz").phrase == "play"
+    assert router.match("playlist of the week", fuzzy=False) is None
+    assert router.match("playlist of the week") is None
+
+
+def test_alias_routes_to_canonical_phrase(router):
+    match = router.match("show me the time please")
+    assert match.phrase == "what time is it"
+    assert match.argument == "please"
+
+
+def test_alias_for_unknown_phrase_is_rejected(router):
+    with pytest.raises(KeyError):
+        router.add_alias("shut", "shutdown")
+
+
+def test_fuzzy_fallback_accepts_a_misheard_whole_command(router):
+    match = router.match("what tim is it")
+    assert match.phrase == "what time is it"
+    assert match.fuzzy
+
+
+def test_fuzzy_fallback_needs_the_whole_utterance_to_be_close(router):
+    # "closer" starts like "close" but is neither a word-boundary hit nor close enough as a whole
+    assert router.match("closer look at the stars") is None
+    assert router.match("closer").phrase == "close"  # One word, well above the 0.84 cutoff
+
+
+def test_fuzzy_fallback_only_considers_fuzzy_phrases(router):
+    assert router.match("serch") is None  # "search" is not in fuzzy_phrases
+
+
+def test_fuzzy_can_be_disabled(router):
+    assert router.match("what tim is it", fuzzy=False) is None
+
+
+def test_search_returns_leftmost_hit(router):
+    match = router.search("could you close the door and play music")
+    assert match.phrase == "close"
+    assert match.argument == "the door and play music"
+
+
+def test_search_skips_partial_words(router):
+    match = router.search("the playlist is done so play music")
+    assert match.phrase == "play music"
+    assert match.argument == ""
+
+
+def test_search_without_a_hit(router):
+    assert router.search("nothing to see here") is None
+
+
+def test_registration_after_compile_is_picked_up(router):
+    assert router.match("reboot") is None
+    router.register("reboot", handler("reboot"), aliases=("restart",))
+    assert router.match("restart now").phrase == "reboot"
+    assert len(router) == 9  # Seven phrases and two aliases
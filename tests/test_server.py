@@ -0,0 +1,144 @@
+import asyncio
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from gideon import AdmissionError, FakeCompletionServer, GideonServer, LLMClientPool
+
+
+async def until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+def test_pool_queues_up_to_max_waiting_then_refuses():
+    async def run():
+        pool = LLMClientPool(api_key="gideon-offline", max_in_flight=1, max_waiting=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with pool.admit():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        try:
+            await until(lambda: pool.in_flight == 1)
+            waiter = asyncio.create_task(hold())
+            await until(lambda: pool.waiting == 1)
+            with pytest.raises(AdmissionError):
+                async with pool.admit():
+                    pass
+        finally:
+            release.set()
+        await asyncio.gather(holder, waiter)
+        return pool
+
+    pool = asyncio.run(run())
+    assert pool.stats == {"admitted": 2, "rejected": 1, "peak_in_flight": 1, "peak_waiting": 1}
+    assert (pool.in_flight, pool.waiting) == (0, 0)
+    assert pool.telemetry.summary()["admission"]["count"] == 2
+
+
+def test_pool_refuses_a_request_that_waits_too_long():
+    async def run():
+        pool = LLMClientPool(api_key="gideon-offline", max_in_flight=1, queue_timeout=0.05)
+        async with pool.admit():
+            with pytest.raises(AdmissionError, match="within 0.05 s"):
+                async with pool.admit():
+                    pass
+        async with pool.admit():  # The slot is free again
+            pass
+        return pool
+
+    pool = asyncio.run(run())
+    assert pool.stats["rejected"] == 1 and pool.stats["admitted"] == 2 and pool.waiting == 0
+
+
+async def request(server, method, path, payload=None):
+    """One HTTP request in a worker thread. Returns (status, headers, decoded JSON body)."""
+    def send():
+        data = json.dumps(payload).encode() if payload is not None else None
+        req = urllib.request.Request(server.url + path, data=data, method=method, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(req, timeout=10) as response:
+                return response.status, response.headers, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, json.loads(e.read())
+    return await asyncio.to_thread(send)
+
+
+@pytest.fixture
+def completions():
+    with FakeCompletionServer(reply="The timeline is stable.", token_delay=0) as fake:
+        yield fake
+
+
+def make_server(completions, **kwargs):
+    pool = LLMClientPool(api_key="gideon-offline", base_url=completions.base_url, max_in_flight=1, max_waiting=0)
+    return GideonServer(port=0, client_pool=pool, **kwargs)
+
+
+def test_sessions_beyond_max_sessions_get_503(completions):
+    async def run():
+        server = await make_server(completions, max_sessions=1).start()
+        try:
+            status, _, first = await request(server, "POST", "/sessions")
+            assert status == 201 and first["open"] and first["replies"]
+            status, headers, refused = await request(server, "POST", "/sessions")
+            assert status == 503 and headers["Retry-After"] == "1" and "all 1 sessions are in use" in refused["error"]
+            assert (await request(server, "DELETE", f"/sessions/{first['session_id']}"))[0] == 200
+            assert (await request(server, "POST", "/sessions"))[0] == 201
+            return server.status()
+        finally:
+            await server.stop()
+
+    status = asyncio.run(run())
+    assert status["sessions_opened"] == 2 and status["sessions_refused"] == 1
+
+
+def test_turn_the_pool_cannot_admit_gets_503(completions):
+    async def run():
+        server = await make_server(completions).start()
+        try:
+            _, _, session = await request(server, "POST", "/sessions")
+            turn = f"/sessions/{session['session_id']}/turns"
+            status, _, reply = await request(server, "POST", turn, {"text": "tell me about the speed force"})
+            assert status == 200 and reply["replies"][-1]["text"] == "The timeline is stable."
+            async with server.pool.admit():  # Every model slot is taken and nothing may queue
+                status, headers, refused = await request(server, "POST", turn, {"text": "and what about earth two"})
+            assert status == 503 and headers["Retry-After"] == "1" and "at capacity" in refused["error"]
+            status, _, reply = await request(server, "POST", turn, {"text": "what is the time"})  # Commands need no model
+            assert status == 200 and reply["open"]
+            return server.status()
+        finally:
+            await server.stop()
+
+    status = asyncio.run(run())
+    assert status["turns"] == 2 and status["turns_refused"] == 1 and status["errors"] == 0
+    assert status["model_requests"]["rejected"] == 1
+
+
+def test_session_refuses_commands_outside_its_allow_list(completions):
+    async def run():
+        server = await make_server(completions).start()
+        try:
+            _, _, session = await request(server, "POST", "/sessions")
+            turn = f"/sessions/{session['session_id']}/turns"
+            replies = {}
+            for text in ("analyze your brain", "close notepad", "view tasks"):
+                status, _, reply = await request(server, "POST", turn, {"text": text})
+                assert status == 200
+                replies[text] = " ".join(line["text"] for line in reply["replies"])
+            return replies
+        finally:
+            await server.stop()
+
+    replies = asyncio.run(run())
+    assert "not available" in replies["analyze your brain"].lower()
+    assert "not available" in replies["close notepad"].lower()
+    assert "not available" not in replies["view tasks"].lower()
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import threading
+
+from gideon import SpeechCache
+
+
+class FakeSynthesizer:
+    """Writes `size` bytes per synthesis and counts the calls per text."""
+
+    def __init__(self, size=100, delay=0.0):
+        self.size = size
+        self.delay = delay
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, text, path):
+        with self._lock:
+            self.calls[text] = self.calls.get(text, 0) + 1
+        if self.delay:
+            threading.Event().wait(self.delay)
+        with open(path, "wb") as f:
+            f.write(b"\0" * self.size)
+
+
+def test_least_recently_used_file_is_evicted(tmp_path):
+    cache = SpeechCache(tmp_path, max_bytes=250)
+    synthesize = FakeSynthesizer(size=100)
+
+    async def run():
+        first = await cache.fetch("first line", synthesize)
+        await cache.fetch("second line", synthesize)
+        await cache.fetch("first line", synthesize)  # A hit refreshes it
+        await cache.fetch("third line", synthesize)
+        return first
+
+    first = asyncio.run(run())
+    assert first.exists()
+    assert not cache.contains("second line")
+    assert cache.contains("first line") and cache.contains("third line")
+    assert cache.stats() == {"hits": 1, "misses": 3, "hit_rate": 0.25, "entries": 2, "bytes": 200}
+    assert len(list(tmp_path.glob("*.mp3"))) == 2
+
+    asyncio.run(cache.fetch("second line", synthesize))
+    assert synthesize.calls["second line"] == 2  # Evicted, so synthesized again
+
+
+def test_concurrent_requests_share_one_synthesis(tmp_path):
+    cache = SpeechCache(tmp_path)
+    synthesize = FakeSynthesizer(delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*(cache.fetch("Systems nominal.", synthesize) for _ in range(5)))
+
+    paths = asyncio.run(run())
+    assert synthesize.calls == {"Systems nominal.": 1}
+    assert len(set(paths)) == 1
+    assert cache.stats()["hits"] == 4
+
+
+def test_voice_and_language_are_part_of_the_key(tmp_path):
+    cache = SpeechCache(tmp_path)
+    synthesize = FakeSynthesizer()
+    asyncio.run(cache.fetch("Good evening.", synthesize, lang="en", tld="co.uk"))
+
+    assert cache.contains("Good evening.", lang="en", tld="co.uk")
+    assert not cache.contains("Good evening.", lang="en", tld="com")
+
+
+def test_index_is_rebuilt_from_disk_oldest_first(tmp_path):
+    cache = SpeechCache(tmp_path, max_bytes=250)
+    synthesize = FakeSynthesizer(size=100)
+    asyncio.run(cache.fetch("older", synthesize))
+    asyncio.run(cache.fetch("newer", synthesize))
+    os.utime(cache.path_for(cache.key("older", "gtts", "en", "co.uk")), (1, 1))
+    (tmp_path / "leftover.abc.part").write_bytes(b"partial")
+
+    reopened = SpeechCache(tmp_path, max_bytes=250)
+    assert not list(tmp_path.glob("*.part"))
+    assert reopened.stats()["entries"] == 2 and reopened.stats()["bytes"] == 200
+
+    asyncio.run(reopened.fetch("newest", synthesize))
+    assert not reopened.contains("older")
+    assert reopened.contains("newer") and reopened.contains("newest")
+
+
+def test_failed_synthesis_leaves_nothing_behind(tmp_path):
+    cache = SpeechCache(tmp_path)
+
+    def broken(text, path):
+        with open(path, "wb") as f:
+            f.write(b"half")
+        raise RuntimeError("voice offline")
+
+    async def run():
+        try:
+            await cache.fetch("Hello.", broken)
+        except RuntimeError as e:
+            return e
+
+    assert str(asyncio.run(run())) == "voice offline"
+    assert not cache.contains("Hello.")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,80 @@
+import pytest
+
+from gideon import TimeVault
+
+
+@pytest.fixture
+def vault_path(tmp_path):
+    path = tmp_path / "vault.txt"
+    path.write_text("".join(f"Record {i}: all quiet in sector {i % 7}\n" for i in range(1000)))
+    return path
+
+
+def test_pages_are_read_through_the_sparse_index(vault_path):
+    with TimeVault(vault_path, stride=16) as vault:
+        assert vault.page(0) == [f"Record {i}: all quiet in sector {i % 7}" for i in range(10)]
+        assert vault.page(57)[0].startswith("Record 570:")  # Past many checkpoints
+        assert vault.page(3)[9].startswith("Record 39:")  # Earlier pages come from the index built so far
+        assert vault.records(995, 10) == [f"Record {i}: all quiet in sector {i % 7}" for i in range(995, 1000)]
+        assert vault.page(100) == []
+        assert vault.records(0, 0) == []
+
+
+def test_empty_vault(tmp_path):
+    path = tmp_path / "vault.txt"
+    path.write_text("")
+    with TimeVault(path) as vault:
+        assert vault.page(0) == []
+        assert vault.search("anything") == []
+
+
+def test_search_is_case_insensitive_and_returns_record_offsets(vault_path):
+    data = vault_path.read_bytes()
+    with TimeVault(vault_path) as vault:
+        hits = vault.search("RECORD 99", limit=20)
+        assert [record for _, record in hits] == [f"Record {i}: all quiet in sector {i % 7}" for i in (99, *range(990, 1000))]
+        for offset, record in hits:
+            assert data[offset:].startswith(record.encode())
+        assert len(vault.search("quiet", limit=3)) == 3
+        assert vault.search("reverse-flash") == []
+        assert vault.search("   ") == []
+
+
+def test_search_finds_a_keyword_across_a_chunk_boundary(vault_path):
+    with TimeVault(vault_path) as vault:
+        expected = vault.search("sector 3", limit=1000)
+        assert vault.search("sector 3", limit=1000, chunk_size=37) == expected  # Many boundaries, no misses or repeats
+        assert vault.search("quiet in sector 3 quiet") == []
+
+
+def test_one_hit_per_record(tmp_path):
+    path = tmp_path / "vault.txt"
+    path.write_text("speed force, speed force\nnothing\nspeed force\n")
+    with TimeVault(path) as vault:
+        assert vault.search("speed force") == [(0, "speed force, speed force"), (33, "speed force")]
+
+
+def test_appends_are_seen_by_an_open_vault(vault_path):
+    with TimeVault(vault_path, stride=16) as vault:
+        assert vault.page(99)[-1].startswith("Record 999:")
+        offset = vault.append("Reverse-Flash   sighting\nconfirmed")
+        assert vault.records(1000, 1) == ["Reverse-Flash sighting confirmed"]  # Whitespace collapsed to one record
+        assert vault.search("sighting") == [(offset, "Reverse-Flash sighting confirmed")]
+
+
+def test_append_terminates_an_unterminated_last_line(tmp_path):
+    path = tmp_path / "vault.txt"
+    path.write_text("first entry")
+    with TimeVault(path) as vault:
+        assert vault.append("second entry") == len("first entry") + 1
+        assert vault.page(0) == ["first entry", "second entry"]
+
+
+def test_replaced_file_is_reopened(vault_path, tmp_path):
+    with TimeVault(vault_path, stride=16) as vault:
+        assert vault.page(50)[0].startswith("Record 500:")
+        replacement = tmp_path / "new.txt"
+        replacement.write_text("fresh start\n")
+        replacement.replace(vault_path)
+        assert vault.page(0) == ["fresh start"]
+        assert vault.page(50) == []